@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import marshal
 import os
 import pickle
 import sys
@@ -146,19 +147,63 @@ class SafeApplication:
         self.display_mini_header = app.display_mini_header
 
 
+def get_app_protocol() -> int:
+    """
+    Returns the latest version of the communication protocol understood by the invoking application,
+    older versions of which do not advertise it.
+    """
+    try:
+        return int(os.environ.get('HATCH_APP_PROTOCOL', '1'))
+    except ValueError:
+        return 1
+
+
 def format_app_command(method: str, *args: Any, **kwargs: Any) -> str:
     procedure = pickle.dumps((method, args, kwargs), 4)
 
     return f"__HATCH__:{''.join('%02x' % i for i in procedure)}"
 
 
+def format_app_frame(method: str, *args: Any, **kwargs: Any) -> bytes:
+    # Pin the format version since the application may run on a different version of Python
+    try:
+        procedure = marshal.dumps((method, args, kwargs), 4)
+    # Values that cannot be marshaled, like paths, are sent the way they would be displayed
+    except ValueError:
+        args = tuple(_to_marshalable(arg) for arg in args)
+        kwargs = {key: _to_marshalable(value) for key, value in kwargs.items()}
+        procedure = marshal.dumps((method, args, kwargs), 4)
+
+    return b'__HATCH2__\n' + len(procedure).to_bytes(4, 'big') + procedure
+
+
 def get_application(*, called_by_app: bool) -> InvokedApplication | Application:
     return InvokedApplication() if called_by_app else Application()
 
 
 def send_app_command(method: str, *args: Any, **kwargs: Any) -> None:
-    _send_app_command(format_app_command(method, *args, **kwargs))
+    # Frames require binary output, which is unavailable when plugins redirect to in-memory text streams
+    if get_app_protocol() >= 2 and hasattr(sys.stdout, 'buffer'):  # noqa: PLR2004
+        _send_app_frame(format_app_frame(method, *args, **kwargs))
+    else:
+        _send_app_command(format_app_command(method, *args, **kwargs))
+
+
+def _to_marshalable(value: Any) -> Any:
+    try:
+        marshal.dumps(value, 4)
+    except ValueError:
+        return str(value)
+
+    return value
 
 
 def _send_app_command(command: str) -> None:
     print(command)
+
+
+def _send_app_frame(frame: bytes) -> None:
+    # Preserve ordering with respect to any text that has yet to be written
+    sys.stdout.flush()
+    sys.stdout.buffer.write(frame)
+    sys.stdout.buffer.flush()
@@ -18,7 +18,6 @@ from hatch.cli.shell import shell
 from hatch.cli.status import status
 from hatch.cli.version import version
 from hatch.config.constants import AppEnvVars, ConfigEnvVars
-from hatch.project.core import Project
 from hatch.utils.ci import running_in_ci
 from hatch.utils.fs import Path
 
@@ -151,10 +150,14 @@ def hatch(ctx: click.Context, env_name, project, verbose, quiet, color, interact
     app.data_dir = Path(data_dir or app.config.dirs.data).expand()
     app.cache_dir = Path(cache_dir or app.config.dirs.cache).expand()
 
+    from hatch.project.core import Project
+
     if project:
-        app.project = Project.from_config(app.config, project)
-        if app.project is None or app.project.root is None:
+        possible_project = Project.from_config(app.config, project)
+        if possible_project is None or possible_project.root is None:
             app.abort(f'Unable to locate project {project}')
+        else:
+            app.project = possible_project
 
         return
 
@@ -1,36 +1,94 @@
 from __future__ import annotations
 
+import marshal
 import os
+import pickle
 import sys
-from functools import cached_property
-from typing import TYPE_CHECKING, cast
+from binascii import unhexlify
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any
 
 from hatch.cli.terminal import Terminal
-from hatch.config.user import ConfigFile, RootConfig
-from hatch.project.core import Project
 from hatch.utils.fs import Path
-from hatch.utils.platform import Platform
 
 if TYPE_CHECKING:
     from packaging.requirements import Requirement
 
+    from hatch.config.user import ConfigFile, RootConfig
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.project.core import Project
+    from hatch.utils.platform import Platform
+
+# Protocol version 1 sends each procedure hex-encoded on a single line with this prefix
+_HATCH_PREFIX = b'__HATCH__:'
+# Protocol version 2 sends this at the end of a line followed by a length-prefixed marshal frame
+_HATCH_SENTINEL = b'__HATCH2__'
+# Procedures consist mostly of primitive values so these are the only globals that pickled ones may reference
+_SAFE_PICKLE_GLOBALS = frozenset(
+    (
+        # Primitive types that pickle reconstructs by calling the type
+        ('builtins', 'bytearray'),
+        ('builtins', 'complex'),
+        # Paths are commonly displayed by plugins, with the module being private starting with Python 3.13
+        ('pathlib', 'PosixPath'),
+        ('pathlib', 'WindowsPath'),
+        ('pathlib._local', 'PosixPath'),
+        ('pathlib._local', 'WindowsPath'),
+    )
+)
+
 
 class Application(Terminal):
+    __slots__ = (
+        '__exit_func',
+        '_env_class_cache',
+        'data_dir',
+        'cache_dir',
+        'project',
+        'env',
+        'env_active',
+    )
+
+    # Environment classes and their option types, keyed by environment type
+    _env_class_cache: dict[str, tuple[type[EnvironmentInterface], dict]]
+
+    # Set by the root command as we acquire more knowledge about the environment
+    data_dir: Path
+    cache_dir: Path
+    project: Project
+    env: str
+    env_active: str | None
+
     def __init__(self, exit_func, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.platform = Platform(self.output)
         self.__exit_func = exit_func
 
-        self.config_file = ConfigFile()
-        self.quiet = self.verbosity < 0
-        self.verbose = self.verbosity > 0
+        self._env_class_cache = {}
+
+    @property
+    def quiet(self) -> bool:
+        return self.verbosity < 0
+
+    @property
+    def verbose(self) -> bool:
+        return self.verbosity > 0
+
+    @cached_property
+    def platform(self) -> Platform:
+        from hatch.utils.platform import Platform
+
+        return Platform(self.output)
+
+    @cached_property
+    def config_file(self) -> ConfigFile:
+        from hatch.config.user import ConfigFile
+
+        return ConfigFile()
 
-        # Lazily set these as we acquire more knowledge about the environment
-        self.data_dir = cast(Path, None)
-        self.cache_dir = cast(Path, None)
-        self.project = cast(Project, None)
-        self.env = cast(str, None)
-        self.env_active = cast(str, None)
+    @cached_property
+    def _env_base(self) -> str:
+        # Join as strings to avoid creating intermediate paths for every environment
+        return os.path.join(self.data_dir, 'env')
 
     @property
     def plugins(self):
@@ -49,11 +107,19 @@ class Application(Terminal):
 
         config = self.project.config.envs[env_name]
         environment_type = config['type']
-        environment_class = self.plugins.environment.get(environment_type)
-        if environment_class is None:
-            self.abort(f'Environment `{env_name}` has unknown type: {environment_type}')
+        cached_entry = self._env_class_cache.get(environment_type)
+        if cached_entry is None:
+            environment_class = self.plugins.environment.get(environment_type)
+            if environment_class is None:
+                self.abort(f'Environment `{env_name}` has unknown type: {environment_type}')
 
-        self.project.config.finalize_env_overrides(environment_class.get_option_types())
+            cached_entry = self._env_class_cache[environment_type] = (
+                environment_class,
+                environment_class.get_option_types(),
+            )
+
+        environment_class, option_types = cached_entry
+        self.project.config.finalize_env_overrides(option_types)
 
         return environment_class(
             self.project.location,
@@ -62,7 +128,7 @@ class Application(Terminal):
             config,
             self.project.config.matrix_variables.get(env_name, {}),
             self.get_env_directory(environment_type),
-            self.data_dir / 'env' / environment_type,
+            Path(os.path.join(self._env_base, environment_type)),
             self.platform,
             self.verbosity,
             self.get_safe_application(),
@@ -91,6 +157,13 @@ class Application(Terminal):
                     with self.status('Running post-installation commands'):
                         self.run_shell_commands(environment, environment.post_install_commands, source='post-install')
 
+                # Installing the project may also install its dependencies so only those specific to the
+                # environment could be missing, and features are checked to validate dynamic metadata
+                if environment.INSTALLS_PROJECT_DEPENDENCIES and not (
+                    environment.environment_dependencies or environment.features
+                ):
+                    return
+
         with self.status('Checking dependencies'):
             dependencies_in_sync = environment.dependencies_in_sync()
 
@@ -99,26 +172,48 @@ class Application(Terminal):
                 environment.sync_dependencies()
 
     def run_shell_commands(
-        self, environment, commands: list[str], source='cmd', *, force_continue=False, show_code_on_error=True
+        self,
+        environment,
+        commands: list[str],
+        source='cmd',
+        *,
+        force_continue=False,
+        show_code_on_error=True,
+        parallel=False,
     ):
         with environment.command_context():
+            # Resolve everything before running anything so that invalid commands are reported up front,
+            # parsing as we go since commands prefixed with a hyphen ignore errors
             try:
-                resolved_commands = list(environment.resolve_commands(commands))
+                parsed_commands = [
+                    (command, True, command[2:]) if command.startswith('- ') else (command, force_continue, command)
+                    for command in environment.resolve_commands(commands)
+                ]
             except Exception as e:
                 self.abort(str(e))
 
             first_error_code = None
-            should_display_command = self.verbose or len(resolved_commands) > 1
-            for i, command in enumerate(resolved_commands, 1):
+            should_display_command = self.verbose or len(parsed_commands) > 1
+
+            # Order is irrelevant when every command runs regardless of whether the others fail
+            if parallel and force_continue:
+                return_codes = self.run_shell_commands_concurrently(
+                    environment,
+                    [(command, shell_command) for command, _, shell_command in parsed_commands],
+                    source,
+                    display_commands=should_display_command,
+                )
+                first_error_code = next((code for code in return_codes if code), None)
+                if first_error_code:
+                    self.abort(code=first_error_code)
+
+                return
+
+            for i, (command, continue_on_error, shell_command) in enumerate(parsed_commands, 1):
                 if should_display_command:
                     self.display(f'{source} [{i}] | {command}')
 
-                continue_on_error = force_continue
-                if command.startswith('- '):
-                    continue_on_error = True
-                    command = command[2:]
-
-                process = environment.run_shell_command(command)
+                process = environment.run_shell_command(shell_command)
                 if process.returncode:
                     first_error_code = first_error_code or process.returncode
                     if continue_on_error:
@@ -131,17 +226,36 @@ class Application(Terminal):
             if first_error_code and force_continue:
                 self.abort(code=first_error_code)
 
-    def attach_builder(self, process):
-        import pickle
+    def run_shell_commands_concurrently(
+        self, environment, commands: list[tuple[str, str]], source: str, *, display_commands: bool
+    ) -> list[int]:
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        display_lock = threading.Lock()
+
+        def run_shell_command(i: int, command: str, shell_command: str) -> int:
+            if display_commands:
+                with display_lock:
+                    self.display(f'{source} [{i}] | {command}')
 
+            return environment.run_shell_command(shell_command).returncode
+
+        with ThreadPoolExecutor(max_workers=min(len(commands), os.cpu_count() or 1) or 1) as executor:
+            futures = [
+                executor.submit(run_shell_command, i, command, shell_command)
+                for i, (command, shell_command) in enumerate(commands, 1)
+            ]
+            return [future.result() for future in futures]
+
+    def attach_builder(self, process):
         with process:
-            for line in self.platform.stream_process_output(process):
-                indicator, _, procedure = line.partition(':')
-                if indicator != '__HATCH__':  # no cov
-                    self.display_info(line, end='')
+            for line, procedure in self.stream_builder_output(process):
+                if procedure is None:  # no cov
+                    self.display_info(line.decode('utf-8'), end='')
                     continue
 
-                method, args, kwargs = pickle.loads(bytes.fromhex(procedure.rstrip()))  # noqa: S301
+                method, args, kwargs = procedure
                 if method == 'abort':
                     process.communicate()
 
@@ -151,24 +265,53 @@ class Application(Terminal):
             self.abort(code=process.returncode)
 
     def read_builder(self, process):
-        import pickle
-
-        lines = []
+        # Accumulate in place rather than keeping every line around to be joined at the end
+        buffer = bytearray()
         with process:
-            for line in self.platform.stream_process_output(process):
-                indicator, _, procedure = line.partition(':')
-                if indicator != '__HATCH__':  # no cov
-                    lines.append(line)
+            for line, procedure in self.stream_builder_output(process):
+                if procedure is None:  # no cov
+                    buffer += line
                 else:
-                    _, args, _ = pickle.loads(bytes.fromhex(procedure))  # noqa: S301
-                    lines.append(args[0])
+                    _, args, _ = procedure
+                    buffer += args[0].encode('utf-8')
 
-        output = ''.join(lines)
+        output = buffer.decode('utf-8')
         if process.returncode:
             self.abort(output, code=process.returncode)
 
         return output
 
+    def stream_builder_output(self, process):
+        for line in self.platform.stream_process_output_bytes(process):
+            is_procedure, procedure = _parse_builder_line(line)
+            if is_procedure:
+                try:
+                    loaded_procedure = _load_procedure(unhexlify(procedure.rstrip()))
+                # Invalid hexadecimal data raises a subclass of ValueError
+                except (EOFError, ValueError, pickle.UnpicklingError) as e:
+                    self.abort(f'Builder process sent a malformed procedure: {e}')
+
+                yield line, loaded_procedure
+            elif line.rstrip(b'\r\n').endswith(_HATCH_SENTINEL):
+                # Text that was written without a trailing newline precedes the sentinel on the same line
+                text = line.rstrip(b'\r\n')[: -len(_HATCH_SENTINEL)]
+                if text:
+                    yield text, None
+
+                header = process.stdout.read(4)
+                size = int.from_bytes(header, 'big')
+                frame = process.stdout.read(size)
+                if len(header) != 4 or len(frame) != size:  # noqa: PLR2004
+                    self.abort('Builder process ended before sending a complete procedure')
+
+                procedure = _load_frame(frame)
+                if procedure is None:
+                    self.abort('Builder process sent a malformed procedure')
+
+                yield line, procedure
+            else:
+                yield line, None
+
     def ensure_environment_plugin_dependencies(self) -> None:
         self.ensure_plugin_dependencies(
             self.project.config.env_requires_complex, wait_message='Syncing environment plugin requirements'
@@ -178,27 +321,23 @@ class Application(Terminal):
         if not dependencies:
             return
 
+        sync_cache = PluginSyncCache(self.cache_dir, dependencies)
+        if sync_cache.is_valid():
+            return
+
         from hatch.env.utils import add_verbosity_flag
         from hatchling.dep.core import dependencies_in_sync
 
         if dependencies_in_sync(dependencies):
+            sync_cache.save()
             return
 
-        command = [
-            sys.executable,
-            '-u',
-            '-m',
-            'pip',
-            'install',
-            '--disable-pip-version-check',
-            '--no-python-version-warning',
-        ]
+        command = get_plugin_install_command()
 
         # Default to -1 verbosity
         add_verbosity_flag(command, self.verbosity, adjustment=-1)
 
-        for dependency in dependencies:
-            command.append(str(dependency))
+        command.extend(map(str, dependencies))
 
         with self.status(wait_message):
             self.platform.check_command(command)
@@ -211,9 +350,9 @@ class Application(Terminal):
             if os.path.isabs(path):
                 return path
             else:
-                return self.project.location / path
+                return Path(os.path.join(self.project.location, path))
         else:
-            return self.data_dir / 'env' / environment_type
+            return Path(os.path.join(self._env_base, environment_type))
 
     def get_python_manager(self, directory: str | None = None):
         from hatch.python.core import PythonManager
@@ -228,6 +367,41 @@ class Application(Terminal):
 
     @cached_property
     def shell_data(self) -> tuple[str, str]:
+        import json
+
+        # Detection inspects the process tree so persist the result for the invoking shell session
+        try:
+            tty = os.ttyname(0)
+        except (AttributeError, OSError):
+            tty = None
+
+        session = {'ppid': os.getppid(), 'tty': tty}
+        cache_file = self.cache_dir / 'shell.json'
+        try:
+            cached_data = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass
+        else:
+            if (
+                isinstance(cached_data, dict)
+                and all(cached_data.get(k) == v for k, v in session.items())
+                and isinstance(cached_data.get('shell_name'), str)
+                and isinstance(cached_data.get('shell_path'), str)
+            ):
+                return cached_data['shell_name'], cached_data['shell_path']
+
+        shell_name, shell_path = self._detect_shell()
+        try:
+            cache_file.ensure_parent_dir_exists()
+            cache_file.write_atomic(
+                json.dumps({**session, 'shell_name': shell_name, 'shell_path': shell_path}), 'w', encoding='utf-8'
+            )
+        except OSError:  # no cov
+            pass
+
+        return shell_name, shell_path
+
+    def _detect_shell(self) -> tuple[str, str]:
         import shellingham
 
         try:
@@ -245,21 +419,163 @@ class Application(Terminal):
         return SafeApplication(self)
 
 
+def _parse_builder_line(raw: bytes) -> tuple[bool, bytes]:
+    if raw.startswith(_HATCH_PREFIX):
+        return True, raw[len(_HATCH_PREFIX) :]
+
+    return False, raw
+
+
+def _load_procedure(data: bytes) -> tuple[str, tuple, dict]:
+    from io import BytesIO
+
+    return _get_restricted_unpickler()(BytesIO(data)).load()
+
+
+def _load_frame(data: bytes) -> tuple[str, tuple, dict] | None:
+    # Unlike pickle, loading never calls anything. Code objects may still be constructed but are never
+    # executed, so only the shape of the procedure is validated before it is dispatched.
+    try:
+        procedure = marshal.loads(data)  # noqa: S302
+    except (EOFError, TypeError, ValueError):
+        return None
+
+    if (
+        isinstance(procedure, tuple)
+        and len(procedure) == 3  # noqa: PLR2004
+        and isinstance(procedure[0], str)
+        and isinstance(procedure[1], tuple)
+        and isinstance(procedure[2], dict)
+    ):
+        return procedure
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_restricted_unpickler() -> type:
+    class RestrictedUnpickler(pickle.Unpickler):
+        def find_class(self, module: str, name: str) -> Any:
+            if (module, name) not in _SAFE_PICKLE_GLOBALS:
+                message = f'Forbidden global in builder procedure: {module}.{name}'
+                raise pickle.UnpicklingError(message)
+
+            return super().find_class(module, name)
+
+    return RestrictedUnpickler
+
+
+@lru_cache(maxsize=None)
+def find_uv() -> str | None:
+    import shutil
+
+    return shutil.which('uv')
+
+
+def get_plugin_install_command() -> list[str]:
+    # Prefer UV when available since it resolves and installs significantly faster than pip
+    uv = find_uv()
+    if uv is not None:
+        return [uv, 'pip', 'install', '--python', sys.executable]
+
+    return [
+        sys.executable,
+        '-u',
+        '-m',
+        'pip',
+        'install',
+        '--disable-pip-version-check',
+        '--no-python-version-warning',
+    ]
+
+
+class PluginSyncCache:
+    """
+    Remembers that a set of plugin dependencies was satisfied by the current interpreter so that
+    installed distribution metadata need not be scanned on every invocation. The verdict is invalidated
+    whenever any entry of `sys.path` is modified, which happens when distributions are (un)installed.
+    """
+
+    def __init__(self, cache_dir: Path, dependencies: list[Requirement]):
+        from hashlib import blake2b
+
+        key = blake2b(digest_size=16)
+        key.update(sys.executable.encode('utf-8'))
+        key.update(sys.version.encode('utf-8'))
+        for dependency in sorted(str(dependency) for dependency in dependencies):
+            key.update(b'\0')
+            key.update(dependency.encode('utf-8'))
+
+        self.path = cache_dir / 'plugin_sync' / key.hexdigest()
+
+        # Direct references may require contacting the remote to determine whether they are in sync
+        self.enabled = not any(dependency.url for dependency in dependencies)
+
+    def is_valid(self) -> bool:
+        if not self.enabled or not self.path.is_file():
+            return False
+
+        import json
+
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8')) == self.get_search_path_state()
+        except ValueError:  # no cov
+            return False
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+
+        import json
+
+        try:
+            self.path.ensure_parent_dir_exists()
+            self.path.write_atomic(json.dumps(self.get_search_path_state()), 'w', encoding='utf-8')
+        except OSError:  # no cov
+            pass
+
+    @staticmethod
+    def get_search_path_state() -> dict[str, int | None]:
+        state: dict[str, int | None] = {}
+        for entry in sys.path:
+            try:
+                state[entry] = os.stat(entry).st_mtime_ns
+            except OSError:
+                state[entry] = None
+
+        return state
+
+
 class SafeApplication:
+    _ALLOWED = frozenset(
+        (
+            'abort',
+            'display',
+            'display_critical',
+            'display_info',
+            'display_error',
+            'display_success',
+            'display_waiting',
+            'display_warning',
+            'display_debug',
+            'display_mini_header',
+            # Divergence from what the backend provides
+            'prompt',
+            'confirm',
+            'status',
+            'status_if',
+            'read_builder',
+        )
+    )
+
+    __slots__ = ('_app',)
+
     def __init__(self, app: Application):
-        self.abort = app.abort
-        self.display = app.display
-        self.display_critical = app.display_critical
-        self.display_info = app.display_info
-        self.display_error = app.display_error
-        self.display_success = app.display_success
-        self.display_waiting = app.display_waiting
-        self.display_warning = app.display_warning
-        self.display_debug = app.display_debug
-        self.display_mini_header = app.display_mini_header
-        # Divergence from what the backend provides
-        self.prompt = app.prompt
-        self.confirm = app.confirm
-        self.status = app.status
-        self.status_if = app.status_if
-        self.read_builder = app.read_builder
+        self._app = app
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._ALLOWED:
+            return getattr(self._app, name)
+
+        message = f'{type(self).__name__!r} object has no attribute {name!r}'
+        raise AttributeError(message)
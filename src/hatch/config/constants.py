@@ -6,6 +6,7 @@ class AppEnvVars:
     VERBOSE = 'HATCH_VERBOSE'
     INTERACTIVE = 'HATCH_INTERACTIVE'
     PYTHON = 'HATCH_PYTHON'
+    APP_PROTOCOL = 'HATCH_APP_PROTOCOL'
     # https://no-color.org
     NO_COLOR = 'NO_COLOR'
     FORCE_COLOR = 'FORCE_COLOR'
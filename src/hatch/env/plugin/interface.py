@@ -8,7 +8,7 @@ from os.path import isabs
 from typing import TYPE_CHECKING
 
 from hatch.config.constants import AppEnvVars
-from hatch.env.utils import add_verbosity_flag
+from hatch.env.utils import APP_PROTOCOL_VERSION, add_verbosity_flag
 from hatch.project.utils import format_script_commands, parse_script_command
 from hatch.utils.structures import EnvVars
 
@@ -44,6 +44,14 @@ class EnvironmentInterface(ABC):
     PLUGIN_NAME = ''
     """The name used for selection."""
 
+    INSTALLS_PROJECT_DEPENDENCIES = False
+    """
+    Whether [installing the project](reference.md#hatch.env.plugin.interface.EnvironmentInterface.install_project)
+    also installs its dependencies and any selected [features](../../config/environment/overview.md#features).
+    If so, checking [dependencies](reference.md#hatch.env.plugin.interface.EnvironmentInterface.dependencies_in_sync)
+    is skipped after creation unless the environment defines additional dependencies or selects features.
+    """
+
     def __init__(
         self,
         root,
@@ -655,7 +663,7 @@ class EnvironmentInterface(ABC):
         the user defined either currently or at the time of
         [creation](reference.md#hatch.env.plugin.interface.EnvironmentInterface.create).
         """
-        with self.get_env_vars():
+        with self.get_env_vars(), EnvVars({AppEnvVars.APP_PROTOCOL: APP_PROTOCOL_VERSION}):
             yield
 
     def get_build_process(self, build_environment, **kwargs):
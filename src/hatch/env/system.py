@@ -6,6 +6,7 @@ from hatch.utils.env import PythonInfo
 
 class SystemEnvironment(EnvironmentInterface):
     PLUGIN_NAME = 'system'
+    INSTALLS_PROJECT_DEPENDENCIES = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+# The latest version of the builder communication protocol that Hatch understands
+APP_PROTOCOL_VERSION = '2'
+
 
 def ensure_valid_environment(env_config: dict):
     env_config.setdefault('type', 'virtual')
@@ -11,8 +11,10 @@ from typing import TYPE_CHECKING, Callable
 
 from hatch.config.constants import AppEnvVars
 from hatch.env.plugin.interface import EnvironmentInterface
+from hatch.env.utils import APP_PROTOCOL_VERSION
 from hatch.utils.fs import Path
 from hatch.utils.shells import ShellManager
+from hatch.utils.structures import EnvVars
 from hatch.venv.core import VirtualEnv
 
 if TYPE_CHECKING:
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 
 class VirtualEnvironment(EnvironmentInterface):
     PLUGIN_NAME = 'virtual'
+    INSTALLS_PROJECT_DEPENDENCIES = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -137,7 +140,7 @@ class VirtualEnvironment(EnvironmentInterface):
         if not self.build_environment_exists():
             self.build_virtual_env.create(self.parent_python)
 
-        with self.get_env_vars(), self.build_virtual_env:
+        with self.get_env_vars(), EnvVars({AppEnvVars.APP_PROTOCOL: APP_PROTOCOL_VERSION}), self.build_virtual_env:
             if not dependencies_in_sync(
                 [Requirement(d) for d in dependencies],
                 sys_path=self.build_virtual_env.sys_path,
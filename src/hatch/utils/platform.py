@@ -166,10 +166,14 @@ class Platform:
 
     @staticmethod
     def stream_process_output(process: Popen) -> Iterable[str]:
-        # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
-        for line in iter(process.stdout.readline, b''):  # type: ignore
+        for line in Platform.stream_process_output_bytes(process):
             yield line.decode('utf-8')
 
+    @staticmethod
+    def stream_process_output_bytes(process: Popen) -> Iterable[bytes]:
+        # To avoid blocking never use a pipe's file descriptor iterator. See https://bugs.python.org/issue3907
+        return iter(process.stdout.readline, b'')  # type: ignore
+
     @property
     def default_shell(self) -> str:
         """
@@ -1,4 +1,5 @@
 import os
+import sys
 
 import pytest
 
@@ -913,7 +914,6 @@ def test_install_project_default_dev_mode(
         """
         Creating environment: test
         Installing project in development mode
-        Checking dependencies
         """
     )
 
@@ -972,7 +972,6 @@ def test_install_project_no_dev_mode(hatch, helpers, temp_dir, platform, config_
         """
         Creating environment: test
         Installing project
-        Checking dependencies
         """
     )
 
@@ -1039,7 +1038,6 @@ def test_pre_install_commands(hatch, helpers, temp_dir, config_file):
         Creating environment: test
         Running pre-installation commands
         Installing project in development mode
-        Checking dependencies
         """
     )
     assert (project_path / 'test.txt').is_file()
@@ -1117,7 +1115,6 @@ def test_post_install_commands(hatch, helpers, temp_dir, config_file):
         Creating environment: test
         Installing project in development mode
         Running post-installation commands
-        Checking dependencies
         """
     )
     assert (project_path / 'test.txt').is_file()
@@ -1564,6 +1561,52 @@ def test_plugin_dependencies_unmet(hatch, config_file, helpers, temp_dir, mock_p
     assert env_path.name == project_path.name
 
 
+def test_plugin_dependencies_unmet_uv(hatch, config_file, helpers, temp_dir, mock_plugin_installation, mocker):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    dependency = os.urandom(16).hex()
+    (project_path / DEFAULT_CONFIG_FILE).write_text(
+        helpers.dedent(
+            f"""
+            [env]
+            requires = ["{dependency}"]
+            """
+        )
+    )
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+
+    uv = str(temp_dir / 'uv')
+    mocker.patch('hatch.cli.application.find_uv', return_value=uv)
+    check_command = mocker.patch('hatch.utils.platform.Platform.check_command')
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('env', 'create')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Syncing environment plugin requirements
+        Creating environment: default
+        Checking dependencies
+        """
+    )
+    check_command.assert_called_once_with([uv, 'pip', 'install', '--python', sys.executable, '-q', dependency])
+
+
 def test_plugin_dependencies_met(hatch, config_file, helpers, temp_dir, mock_plugin_installation):
     config_file.model.template.plugins['default']['tests'] = False
     config_file.save()
@@ -1621,3 +1664,114 @@ def test_plugin_dependencies_met(hatch, config_file, helpers, temp_dir, mock_plu
     env_path = env_dirs[0]
 
     assert env_path.name == project_path.name
+
+
+def test_plugin_dependencies_met_cached(hatch, config_file, helpers, temp_dir, mock_plugin_installation, mocker):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+    cache_path = temp_dir / 'cache'
+
+    dependency = 'hatch'
+    (project_path / DEFAULT_CONFIG_FILE).write_text(
+        helpers.dedent(
+            f"""
+            [env]
+            requires = ["{dependency}"]
+            """
+        )
+    )
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), ConfigEnvVars.CACHE: str(cache_path)}):
+        result = hatch('env', 'create')
+
+    assert result.exit_code == 0, result.output
+    assert len(list((cache_path / 'plugin_sync').iterdir())) == 1
+
+    dependencies_in_sync = mocker.patch('hatchling.dep.core.dependencies_in_sync')
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), ConfigEnvVars.CACHE: str(cache_path)}):
+        result = hatch('env', 'create')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Environment `default` already exists
+        """
+    )
+    dependencies_in_sync.assert_not_called()
+    mock_plugin_installation.assert_not_called()
+
+
+@pytest.mark.parametrize('modification', ['install', 'new_entry'])
+def test_plugin_dependencies_met_cached_invalidated(
+    hatch, config_file, helpers, temp_dir, mock_plugin_installation, mocker, modification
+):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+    cache_path = temp_dir / 'cache'
+    site_packages = temp_dir / 'site-packages'
+    site_packages.mkdir()
+    mocker.patch.object(sys, 'path', [*sys.path, str(site_packages)])
+
+    dependency = 'hatch'
+    (project_path / DEFAULT_CONFIG_FILE).write_text(
+        helpers.dedent(
+            f"""
+            [env]
+            requires = ["{dependency}"]
+            """
+        )
+    )
+
+    project = Project(project_path)
+    helpers.update_project_environment(project, 'default', {'skip-install': True, **project.config.envs['default']})
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), ConfigEnvVars.CACHE: str(cache_path)}):
+        result = hatch('env', 'create')
+
+    assert result.exit_code == 0, result.output
+
+    if modification == 'install':
+        mtime = site_packages.stat().st_mtime + 1
+        os.utime(site_packages, (mtime, mtime))
+    else:
+        sys.path.append(str(temp_dir))
+
+    dependencies_in_sync = mocker.patch('hatchling.dep.core.dependencies_in_sync', return_value=True)
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path), ConfigEnvVars.CACHE: str(cache_path)}):
+        result = hatch('env', 'create')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Environment `default` already exists
+        """
+    )
+    dependencies_in_sync.assert_called_once()
+    mock_plugin_installation.assert_not_called()
@@ -0,0 +1,360 @@
+import json
+import marshal
+import os
+import pickle
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from hatch.config.constants import AppEnvVars
+from hatch.utils.structures import EnvVars
+from hatchling.bridge.app import format_app_command
+
+
+def start_builder(script, protocol='2'):
+    with EnvVars({AppEnvVars.APP_PROTOCOL: protocol}):
+        return subprocess.Popen([sys.executable, '-u', '-c', script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+def get_tty():
+    try:
+        return os.ttyname(0)
+    except (AttributeError, OSError):
+        return None
+
+
+def new_app(cache_dir=None):
+    from hatch.cli.application import Application
+
+    app = Application(sys.exit, verbosity=0, enable_color=False, interactive=False)
+    if cache_dir is not None:
+        app.cache_dir = cache_dir
+
+    return app
+
+
+@pytest.fixture
+def app():
+    return new_app()
+
+
+class TestBuilderOutput:
+    def test_frame_after_unterminated_text(self, app):
+        process = start_builder(
+            'import sys\n'
+            'from hatchling.bridge.app import send_app_command\n'
+            "sys.stdout.write('foo')\n"
+            "send_app_command('display', 'bar')\n"
+            "print('baz')\n"
+        )
+
+        assert app.read_builder(process) == 'foobarbaz\n'
+
+    def test_attach_frame_after_unterminated_text(self, app, capsys):
+        process = start_builder(
+            'import sys\n'
+            'from hatchling.bridge.app import send_app_command\n'
+            "sys.stdout.write('foo')\n"
+            "send_app_command('display_info', 'bar')\n"
+        )
+
+        app.attach_builder(process)
+
+        assert capsys.readouterr().err == 'foobar\n'
+
+    def test_frame_unmarshalable_values(self, app, capsys):
+        process = start_builder(
+            'from hatchling.bridge.app import send_app_command\n'
+            'class Foo:\n'
+            "    def __str__(self): return 'foo'\n"
+            "send_app_command('display_info', Foo(), end=Foo())\n"
+        )
+
+        app.attach_builder(process)
+
+        assert capsys.readouterr().err == 'foofoo'
+
+    def test_text_stream_without_buffer(self, app, capsys):
+        process = start_builder(
+            'import io, sys\n'
+            'from contextlib import redirect_stdout\n'
+            'from hatchling.bridge.app import send_app_command\n'
+            'with redirect_stdout(io.StringIO()) as stdout:\n'
+            "    send_app_command('display_info', 'foo')\n"
+            'sys.__stdout__.write(stdout.getvalue())\n'
+        )
+
+        app.attach_builder(process)
+
+        assert capsys.readouterr().err == 'foo\n'
+
+    def test_incomplete_frame(self, app, capsys):
+        process = start_builder(
+            'import sys\n'
+            'from hatchling.bridge.app import format_app_frame\n'
+            "sys.stdout.buffer.write(format_app_frame('display', 'bar')[:-1])\n"
+        )
+
+        with pytest.raises(SystemExit) as e:
+            app.read_builder(process)
+
+        assert e.value.code == 1
+        assert capsys.readouterr().err == 'Builder process ended before sending a complete procedure\n'
+
+
+def mock_environment(mocker, return_codes):
+    environment = mocker.MagicMock()
+    environment.resolve_commands.side_effect = list
+    environment.run_shell_command.side_effect = lambda command: mocker.MagicMock(returncode=return_codes[command])
+
+    return environment
+
+
+class TestRunShellCommands:
+    def test_parallel(self, app, mocker, capsys):
+        environment = mock_environment(mocker, {'foo': 0, 'bar': 3, 'baz': 5})
+
+        with pytest.raises(SystemExit) as e:
+            app.run_shell_commands(environment, ['foo', '- bar', 'baz'], force_continue=True, parallel=True)
+
+        # The first failure in the order the commands were given is reported
+        assert e.value.code == 3
+        assert sorted(call.args[0] for call in environment.run_shell_command.call_args_list) == ['bar', 'baz', 'foo']
+
+        output = capsys.readouterr()
+        assert sorted(output.out.splitlines()) == ['cmd [1] | foo', 'cmd [2] | - bar', 'cmd [3] | baz']
+        assert not output.err
+
+    def test_parallel_success(self, app, mocker, capsys):
+        environment = mock_environment(mocker, {'foo': 0, 'bar': 0})
+
+        app.run_shell_commands(environment, ['foo', 'bar'], source='test', force_continue=True, parallel=True)
+
+        assert environment.run_shell_command.call_count == 2
+        assert sorted(capsys.readouterr().out.splitlines()) == ['test [1] | foo', 'test [2] | bar']
+
+    def test_parallel_requires_force_continue(self, app, mocker, capsys):
+        environment = mock_environment(mocker, {'foo': 0, 'bar': 3, 'baz': 5})
+
+        with pytest.raises(SystemExit) as e:
+            app.run_shell_commands(environment, ['foo', 'bar', 'baz'], parallel=True)
+
+        assert e.value.code == 3
+        assert [call.args[0] for call in environment.run_shell_command.call_args_list] == ['foo', 'bar']
+
+        output = capsys.readouterr()
+        assert output.out.splitlines() == ['cmd [1] | foo', 'cmd [2] | bar']
+        assert output.err == 'Failed with exit code: 3\n'
+
+
+class TestShellData:
+    @pytest.fixture
+    def app(self, temp_dir):
+        return new_app(temp_dir)
+
+    def test_detect(self, app, temp_dir, mocker):
+        detect_shell = mocker.patch('shellingham.detect_shell', return_value=('zsh', '/bin/zsh'))
+
+        assert app.shell_data == ('zsh', '/bin/zsh')
+        detect_shell.assert_called_once()
+
+        cached_data = json.loads((temp_dir / 'shell.json').read_text())
+        assert cached_data['ppid'] == os.getppid()
+        assert cached_data['shell_name'] == 'zsh'
+        assert cached_data['shell_path'] == '/bin/zsh'
+
+    def test_cached(self, app, temp_dir, mocker):
+        mocker.patch('shellingham.detect_shell', return_value=('zsh', '/bin/zsh'))
+        assert app.shell_data == ('zsh', '/bin/zsh')
+
+        detect_shell = mocker.patch('shellingham.detect_shell', return_value=('fish', '/bin/fish'))
+        assert new_app(temp_dir).shell_data == ('zsh', '/bin/zsh')
+        detect_shell.assert_not_called()
+
+    def test_parent_process_changed(self, app, temp_dir, mocker):
+        mocker.patch('shellingham.detect_shell', return_value=('zsh', '/bin/zsh'))
+        assert app.shell_data == ('zsh', '/bin/zsh')
+
+        mocker.patch('os.getppid', return_value=os.getppid() + 1)
+        detect_shell = mocker.patch('shellingham.detect_shell', return_value=('fish', '/bin/fish'))
+        assert new_app(temp_dir).shell_data == ('fish', '/bin/fish')
+        detect_shell.assert_called_once()
+
+        assert json.loads((temp_dir / 'shell.json').read_text())['shell_name'] == 'fish'
+
+    @pytest.mark.parametrize(
+        'contents',
+        [
+            '{',
+            '[]',
+            'null',
+            {'shell_path': '/bin/fish'},
+            {'shell_name': 'fish', 'shell_path': None},
+        ],
+    )
+    def test_invalid_cache(self, app, temp_dir, mocker, contents):
+        if isinstance(contents, dict):
+            # Matches the current session
+            contents = json.dumps({'ppid': os.getppid(), 'tty': get_tty(), **contents})
+
+        (temp_dir / 'shell.json').write_text(contents)
+        detect_shell = mocker.patch('shellingham.detect_shell', return_value=('zsh', '/bin/zsh'))
+
+        assert app.shell_data == ('zsh', '/bin/zsh')
+        detect_shell.assert_called_once()
+
+        assert json.loads((temp_dir / 'shell.json').read_text())['shell_name'] == 'zsh'
+
+
+class TestPrepareEnvironment:
+    @staticmethod
+    def new_environment(mocker, *, installs_project_dependencies, environment_dependencies=()):
+        environment = mocker.MagicMock(
+            INSTALLS_PROJECT_DEPENDENCIES=installs_project_dependencies,
+            skip_install=False,
+            dev_mode=True,
+            pre_install_commands=[],
+            post_install_commands=[],
+            environment_dependencies=list(environment_dependencies),
+            features=[],
+        )
+        environment.exists.return_value = False
+        environment.dependencies_in_sync.return_value = False
+
+        return environment
+
+    def test_project_dependencies_installed(self, app, mocker):
+        environment = self.new_environment(mocker, installs_project_dependencies=True)
+
+        app.prepare_environment(environment)
+
+        environment.install_project_dev_mode.assert_called_once()
+        environment.dependencies_in_sync.assert_not_called()
+        environment.sync_dependencies.assert_not_called()
+
+    def test_environment_dependencies(self, app, mocker):
+        environment = self.new_environment(mocker, installs_project_dependencies=True, environment_dependencies=['foo'])
+
+        app.prepare_environment(environment)
+
+        environment.dependencies_in_sync.assert_called_once()
+        environment.sync_dependencies.assert_called_once()
+
+    def test_project_dependencies_not_installed(self, app, mocker):
+        environment = self.new_environment(mocker, installs_project_dependencies=False)
+
+        app.prepare_environment(environment)
+
+        environment.install_project_dev_mode.assert_called_once()
+        environment.dependencies_in_sync.assert_called_once()
+        environment.sync_dependencies.assert_called_once()
+
+
+class TestLoadProcedure:
+    def test_primitives(self):
+        from hatch.cli.application import _load_procedure
+
+        procedure = ('display', ('foo', 1, 2.5, None, True, b'bar', [3], {4}), {'style': {'bold': True}})
+
+        assert _load_procedure(pickle.dumps(procedure, 4)) == procedure
+
+    def test_allowed_globals(self):
+        from hatch.cli.application import _load_procedure
+
+        procedure = ('display', (Path('foo'), bytearray(b'bar'), 1j), {})
+
+        assert _load_procedure(pickle.dumps(procedure, 4)) == procedure
+
+    def test_forbidden_global(self):
+        from hatch.cli.application import _load_procedure
+
+        message = f'Forbidden global in builder procedure: {os.system.__module__}.system'
+        with pytest.raises(pickle.UnpicklingError, match=message):
+            _load_procedure(pickle.dumps((os.system, ('echo',), {}), 4))
+
+    def test_builder_line(self, app, mocker):
+        process = mocker.MagicMock(returncode=0)
+        process.stdout = BytesIO(f"{format_app_command('display', 'foo')}\n".encode('utf-8'))
+
+        assert app.read_builder(process) == 'foo'
+
+    @pytest.mark.parametrize('protocol', ['1', '2'])
+    def test_attach_path(self, app, capsys, protocol):
+        process = start_builder(
+            'from pathlib import Path\n'
+            'from hatchling.bridge.app import send_app_command\n'
+            "send_app_command('display_info', Path('foo'))\n",
+            protocol,
+        )
+
+        app.attach_builder(process)
+
+        assert capsys.readouterr().err == 'foo\n'
+
+    def test_attach_forbidden_global(self, app, capsys):
+        process = start_builder(
+            'from hatchling.bridge.app import send_app_command\n'
+            'class Foo: pass\n'
+            "send_app_command('display_info', Foo())\n",
+            '1',
+        )
+
+        with pytest.raises(SystemExit) as e:
+            app.attach_builder(process)
+
+        assert e.value.code == 1
+        assert capsys.readouterr().err == (
+            'Builder process sent a malformed procedure: Forbidden global in builder procedure: __main__.Foo\n'
+        )
+
+    def test_invalid_builder_line(self, app, mocker, capsys):
+        process = mocker.MagicMock(returncode=0)
+        process.stdout = BytesIO(b'__HATCH__:0\n')
+
+        with pytest.raises(SystemExit):
+            app.read_builder(process)
+
+        assert capsys.readouterr().err.startswith('Builder process sent a malformed procedure: ')
+
+
+class TestLoadFrame:
+    def test_procedure(self):
+        from hatch.cli.application import _load_frame
+
+        procedure = ('display', ('foo',), {'style': 'bold'})
+
+        assert _load_frame(marshal.dumps(procedure, 4)) == procedure
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            'display',
+            ('display', ('foo',)),
+            ('display', ['foo'], {}),
+            ('display', ('foo',), []),
+            (b'display', ('foo',), {}),
+            compile('print(1)', '<builder>', 'exec'),
+        ],
+    )
+    def test_malformed(self, value):
+        from hatch.cli.application import _load_frame
+
+        assert _load_frame(marshal.dumps(value, 4)) is None
+
+    def test_invalid(self):
+        from hatch.cli.application import _load_frame
+
+        assert _load_frame(b'\xff') is None
+
+    def test_malformed_frame(self, app, mocker, capsys):
+        data = marshal.dumps(['display', ('foo',), {}], 4)
+        process = mocker.MagicMock(returncode=0)
+        process.stdout = BytesIO(b'__HATCH2__\n' + len(data).to_bytes(4, 'big') + data)
+
+        with pytest.raises(SystemExit):
+            app.read_builder(process)
+
+        assert capsys.readouterr().err == 'Builder process sent a malformed procedure\n'
@@ -1,7 +1,9 @@
+import marshal
 import os
 
 import pytest
 
+from hatch.config.constants import AppEnvVars
 from hatch.project.core import Project
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
 
@@ -89,6 +91,65 @@ def test_show_dynamic_missing_build_dependencies(hatch, helpers, temp_dir):
     )
 
 
+@pytest.mark.parametrize('protocol', ['1', '2'])
+@pytest.mark.usefixtures('local_builder')
+def test_show_dynamic_app_protocol(hatch, helpers, temp_dir, protocol):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        hatch('new', project_name)
+
+    path = temp_dir / 'my-app'
+
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['build-system']['requires'].append('foo')
+    project.save_config(config)
+
+    with path.as_cwd(env_vars={AppEnvVars.APP_PROTOCOL: protocol}):
+        result = hatch('version')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Setting up build environment for missing dependencies
+        0.0.1
+        """
+    )
+
+
+def test_show_dynamic_build_environment_app_protocol(hatch, temp_dir, mocker):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        hatch('new', project_name)
+
+    path = temp_dir / 'my-app'
+
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['build-system']['requires'].append('foo')
+    project.save_config(config)
+
+    # Use the real build environment and builder process without creating a virtual environment
+    mocker.patch('hatch.env.virtual.VirtualEnvironment.build_environment_exists', return_value=True)
+    mocker.patch(
+        'hatch.venv.core.VirtualEnv.executables_directory', new_callable=mocker.PropertyMock, return_value=temp_dir
+    )
+    mocker.patch('hatch.venv.core.VirtualEnv.sys_path', new_callable=mocker.PropertyMock, return_value=[])
+    mocker.patch('hatch.venv.core.VirtualEnv.environment', new_callable=mocker.PropertyMock, return_value={})
+    # Only the build environment considers its dependencies to be satisfied
+    mocker.patch('hatchling.dep.core.dependencies_in_sync', side_effect=[False, True])
+    marshal_module = mocker.patch('hatch.cli.application.marshal', wraps=marshal)
+
+    with path.as_cwd(env_vars={AppEnvVars.APP_PROTOCOL: '1'}):
+        result = hatch('version')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == '0.0.1\n'
+    marshal_module.loads.assert_called_once()
+
+
 @pytest.mark.usefixtures('local_builder')
 def test_plugin_dependencies_unmet(hatch, helpers, temp_dir, mock_plugin_installation):
     project_name = 'My.App'
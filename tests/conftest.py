@@ -305,7 +305,7 @@ def mock_backend_process(request, mocker):
                 else:
                     mock.returncode = 0
 
-                mock.stdout = BytesIO(''.join(line_queue).encode('utf-8'))
+                mock.stdout = BytesIO(b''.join(line_queue))
                 return mock
             finally:
                 sys.argv = original_args
@@ -314,7 +314,10 @@ def mock_backend_process(request, mocker):
 
     mocker.patch('subprocess.Popen', side_effect=mock_process_api(subprocess.Popen))
     mocker.patch('subprocess.run', side_effect=mock_process_api(subprocess.run))
-    mocker.patch('hatchling.bridge.app._send_app_command', side_effect=lambda cmd: line_queue.append(f'{cmd}\n'))
+    mocker.patch(
+        'hatchling.bridge.app._send_app_command', side_effect=lambda cmd: line_queue.append(f'{cmd}\n'.encode('utf-8'))
+    )
+    mocker.patch('hatchling.bridge.app._send_app_frame', side_effect=line_queue.append)
 
     yield True
 
@@ -332,6 +335,7 @@ def mock_plugin_installation(mocker):
         return mocked_subprocess_run
 
     mocker.patch('subprocess.run', side_effect=_mock)
+    mocker.patch('hatch.cli.application.find_uv', return_value=None)
 
     yield mocked_subprocess_run
 